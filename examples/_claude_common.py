@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Claude voice example scripts.
+
+Wake-phrase parsing, claude binary discovery and the PTY-backed
+interactive session live here so every launcher imports one copy and
+optimizations apply everywhere at once.
+"""
+
+import subprocess
+import sys
+import os
+import re
+from functools import lru_cache
+import shutil
+import pty
+import select
+import selectors
+import threading
+import queue
+import termios
+import tty
+import signal
+
+# Wake phrases that trigger Claude
+WAKE_PHRASES = [
+    "claude", "hey claude", "ok claude", "hi claude",
+    "opus", "hey opus", "ok opus",
+    "sonnet", "hey sonnet", "ok sonnet",
+    "haiku", "hey haiku", "ok haiku",
+]
+
+# Single precompiled pattern covering all wake phrases plus optional
+# politeness words, so each utterance is scanned once instead of once
+# per phrase. Longest phrases first so "hey claude" wins over "claude".
+_WAKE_RE = re.compile(
+    r'^.*?\b(?:'
+    + '|'.join(re.escape(p) for p in sorted(WAKE_PHRASES, key=len, reverse=True))
+    + r')\b[,\s]*(?:(?:please|can you|could you|would you)\b\s*)?(.*)$',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Exit intent in either word order, checked in a single scan
+_EXIT_RE = re.compile(
+    r'\bclaude\b.*\bexit\b|\bexit\b.*\bclaude\b',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@lru_cache(maxsize=1)
+def find_claude_binary() -> str:
+    """Find the claude binary path."""
+    # Let ops skip discovery entirely
+    claude_bin = os.environ.get("CLAUDE_BIN")
+    if claude_bin:
+        return claude_bin
+
+    locations = [
+        shutil.which("claude"),
+        os.path.expanduser("~/.claude/local/claude"),
+        "/usr/local/bin/claude",
+        "/opt/homebrew/bin/claude",
+    ]
+
+    for loc in locations:
+        if loc and os.path.isfile(loc) and os.access(loc, os.X_OK):
+            return loc
+
+    try:
+        # Plain sh avoids the interactive zsh rc-file startup cost
+        result = subprocess.run(
+            ["/bin/sh", "-c", "command -v claude"],
+            capture_output=True, text=True, timeout=1
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            path = result.stdout.strip().split()[-1]
+            if os.path.isfile(path):
+                return path
+    except:
+        pass
+
+    return None
+
+
+def extract_command(text: str) -> str | None:
+    """Extract command after wake phrase."""
+    m = _WAKE_RE.match(text)
+    if not m:
+        return None
+    return m.group(1).strip().lstrip(',').strip()
+
+
+def reset_terminal():
+    """Reset terminal to sane state."""
+    subprocess.run(["stty", "sane"], check=False)
+
+
+class ClaudeInteractiveSession:
+    """Manages an interactive Claude session with PTY."""
+
+    def __init__(self, claude_path: str):
+        self.claude_path = claude_path
+        self.master_fd = None
+        self.pid = None
+        self.running = False
+        self.command_queue = queue.Queue()
+        self._wakeup_r = None
+        self._wakeup_w = None
+
+    def start(self):
+        """Start Claude in a PTY."""
+        # Fork a child process with a PTY
+        self.pid, self.master_fd = pty.fork()
+
+        if self.pid == 0:
+            # Child process - exec Claude
+            os.execv(self.claude_path, [self.claude_path])
+        else:
+            # Parent process
+            self.running = True
+            os.set_blocking(self.master_fd, False)
+
+            # Self-pipe that wakes the event loop when commands are queued
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            os.set_blocking(self._wakeup_r, False)
+
+            # One event loop thread handles Claude output, keyboard input
+            # and queued voice commands (replaces three polling threads)
+            self.io_thread = threading.Thread(target=self._event_loop, daemon=True)
+            self.io_thread.start()
+
+    def _event_loop(self):
+        """Dispatch PTY output, keyboard input and voice commands."""
+        stdin_is_tty = sys.stdin.isatty()
+        old_settings = None
+        selector = selectors.DefaultSelector()
+        selector.register(self.master_fd, selectors.EVENT_READ, self._drain_output)
+        selector.register(self._wakeup_r, selectors.EVENT_READ, self._drain_commands)
+        try:
+            if stdin_is_tty:
+                # Save terminal settings and go raw for
+                # character-by-character keyboard input
+                old_settings = termios.tcgetattr(sys.stdin)
+                tty.setraw(sys.stdin.fileno())
+                selector.register(sys.stdin, selectors.EVENT_READ, self._forward_keyboard)
+
+            while self.running:
+                for key, _ in selector.select(timeout=0.5):
+                    key.data()
+        except (OSError, termios.error):
+            self.running = False
+        finally:
+            # Restore terminal settings
+            if old_settings is not None:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+            selector.close()
+
+    def _drain_output(self):
+        """Read and display output from Claude until the PTY is empty."""
+        while True:
+            try:
+                data = os.read(self.master_fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                # EIO - Claude exited
+                self.running = False
+                break
+            if not data:
+                # EOF - Claude exited
+                self.running = False
+                break
+            sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    def _forward_keyboard(self):
+        """Forward one keystroke to Claude."""
+        char = sys.stdin.read(1)
+        if char:
+            self._write_pty(char.encode())
+
+    def _drain_commands(self):
+        """Process voice commands queued by send_command."""
+        try:
+            os.read(self._wakeup_r, 4096)
+        except BlockingIOError:
+            pass
+        while True:
+            try:
+                cmd = self.command_queue.get_nowait()
+            except queue.Empty:
+                break
+            if cmd == "EXIT":
+                # Send /exit to Claude
+                self._write_pty(b"/exit\n")
+                self.running = False
+            elif cmd:
+                # PTYs accept whole buffers; one write replaces the
+                # per-character write + sleep loop
+                self._write_pty(cmd.encode() + b"\r")
+
+    def _write_pty(self, payload: bytes):
+        """Write a whole buffer to the (non-blocking) PTY."""
+        view = memoryview(payload)
+        while view:
+            try:
+                written = os.write(self.master_fd, view)
+                view = view[written:]
+            except BlockingIOError:
+                select.select([], [self.master_fd], [])
+
+    def send_command(self, command: str):
+        """Queue a voice command and wake the event loop."""
+        self.command_queue.put(command)
+        os.write(self._wakeup_w, b"\0")
+
+    def stop(self):
+        """Stop the Claude session."""
+        self.running = False
+        self.command_queue.put("EXIT")
+        if self._wakeup_w is not None:
+            try:
+                os.write(self._wakeup_w, b"\0")
+            except OSError:
+                pass
+        if self.pid:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+                os.waitpid(self.pid, 0)
+            except:
+                pass
@@ -4,7 +4,6 @@ Basic test of RealtimeSTT with Parakeet MLX
 """
 
 from RealtimeSTT import AudioToTextRecorder
-from RealtimeSTT.audio_recorder import MLX_AVAILABLE, is_parakeet_model, INIT_MODEL_TRANSCRIPTION
 import sys
 
 def main():
@@ -18,6 +17,9 @@ def main():
         recorder = AudioToTextRecorder()
         print("\nRecorder initialized successfully!")
         print("\nModel information:")
+        from RealtimeSTT.audio_recorder import (
+            MLX_AVAILABLE, is_parakeet_model, INIT_MODEL_TRANSCRIPTION
+        )
         if MLX_AVAILABLE and is_parakeet_model(INIT_MODEL_TRANSCRIPTION):
             print("  Using Parakeet MLX (Apple Silicon optimized)")
             print("  Hardware acceleration via Metal GPU")
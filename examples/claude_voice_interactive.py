@@ -10,188 +10,21 @@ Usage:
 """
 
 from RealtimeSTT import AudioToTextRecorder
-import subprocess
+from _claude_common import (
+    _EXIT_RE,
+    ClaudeInteractiveSession,
+    extract_command,
+    find_claude_binary,
+    reset_terminal,
+)
 import sys
-import os
-import re
-import shutil
-import pty
-import select
 import threading
 import queue
-import termios
-import tty
-import signal
-
-# Wake phrases that trigger Claude
-WAKE_PHRASES = [
-    "claude", "hey claude", "ok claude", "hi claude",
-    "opus", "hey opus", "ok opus",
-    "sonnet", "hey sonnet", "ok sonnet",
-    "haiku", "hey haiku", "ok haiku",
-]
 
 # How long to keep listening after wake word (seconds)
 LISTEN_DURATION = 40
 
 
-def find_claude_binary() -> str:
-    """Find the claude binary path."""
-    locations = [
-        shutil.which("claude"),
-        os.path.expanduser("~/.claude/local/claude"),
-        "/usr/local/bin/claude",
-        "/opt/homebrew/bin/claude",
-    ]
-
-    for loc in locations:
-        if loc and os.path.isfile(loc) and os.access(loc, os.X_OK):
-            return loc
-
-    try:
-        result = subprocess.run(
-            ["zsh", "-ic", "which claude"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            path = result.stdout.strip().split()[-1]
-            if os.path.isfile(path):
-                return path
-    except:
-        pass
-
-    return None
-
-
-def extract_command(text: str) -> str | None:
-    """Extract command after wake phrase."""
-    text_lower = text.lower().strip()
-
-    for phrase in WAKE_PHRASES:
-        if phrase in text_lower:
-            parts = text_lower.split(phrase, 1)
-            if len(parts) > 1:
-                cmd = parts[1].strip()
-                cmd = re.sub(r'^[,\s]*(please|can you|could you|would you)\s*', '', cmd)
-                if cmd:
-                    return text.split(phrase)[-1].strip().lstrip(',').strip()
-            return ""
-    return None
-
-
-def reset_terminal():
-    """Reset terminal to sane state."""
-    subprocess.run(["stty", "sane"], check=False)
-
-
-class ClaudeInteractiveSession:
-    """Manages an interactive Claude session with PTY."""
-
-    def __init__(self, claude_path: str):
-        self.claude_path = claude_path
-        self.master_fd = None
-        self.pid = None
-        self.running = False
-        self.command_queue = queue.Queue()
-
-    def start(self):
-        """Start Claude in a PTY."""
-        # Fork a child process with a PTY
-        self.pid, self.master_fd = pty.fork()
-
-        if self.pid == 0:
-            # Child process - exec Claude
-            os.execv(self.claude_path, [self.claude_path])
-        else:
-            # Parent process
-            self.running = True
-
-            # Start threads for I/O
-            self.output_thread = threading.Thread(target=self._read_output, daemon=True)
-            self.output_thread.start()
-
-            self.input_thread = threading.Thread(target=self._process_commands, daemon=True)
-            self.input_thread.start()
-
-            # Also allow keyboard input
-            self.keyboard_thread = threading.Thread(target=self._read_keyboard, daemon=True)
-            self.keyboard_thread.start()
-
-    def _read_output(self):
-        """Read and display output from Claude."""
-        while self.running:
-            try:
-                r, _, _ = select.select([self.master_fd], [], [], 0.1)
-                if r:
-                    data = os.read(self.master_fd, 4096)
-                    if data:
-                        sys.stdout.buffer.write(data)
-                        sys.stdout.buffer.flush()
-                    else:
-                        # EOF - Claude exited
-                        self.running = False
-                        break
-            except OSError:
-                self.running = False
-                break
-
-    def _read_keyboard(self):
-        """Read keyboard input and forward to Claude."""
-        # Save terminal settings
-        old_settings = termios.tcgetattr(sys.stdin)
-        try:
-            # Set terminal to raw mode for character-by-character input
-            tty.setraw(sys.stdin.fileno())
-
-            while self.running:
-                r, _, _ = select.select([sys.stdin], [], [], 0.1)
-                if r:
-                    char = sys.stdin.read(1)
-                    if char:
-                        os.write(self.master_fd, char.encode())
-        except:
-            pass
-        finally:
-            # Restore terminal settings
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-
-    def _process_commands(self):
-        """Process voice commands from the queue."""
-        import time
-        while self.running:
-            try:
-                cmd = self.command_queue.get(timeout=0.5)
-                if cmd == "EXIT":
-                    # Send /exit to Claude
-                    os.write(self.master_fd, b"/exit\n")
-                    break
-                elif cmd:
-                    # Send the command character by character for reliability
-                    for char in cmd:
-                        os.write(self.master_fd, char.encode())
-                        time.sleep(0.01)  # Small delay between characters
-                    # Send Enter key (carriage return)
-                    time.sleep(0.05)
-                    os.write(self.master_fd, b"\r")
-            except queue.Empty:
-                continue
-
-    def send_command(self, command: str):
-        """Queue a voice command to send to Claude."""
-        self.command_queue.put(command)
-
-    def stop(self):
-        """Stop the Claude session."""
-        self.running = False
-        self.command_queue.put("EXIT")
-        if self.pid:
-            try:
-                os.kill(self.pid, signal.SIGTERM)
-                os.waitpid(self.pid, 0)
-            except:
-                pass
-
-
 class VoiceHandler:
     """Handles voice input with wake word detection."""
 
@@ -217,7 +50,7 @@ class VoiceHandler:
                 print("\n[🔇 Deactivated - say 'Claude' to reactivate]")
 
             # Check for exit
-            if "exit" in text.lower() and "claude" in text.lower():
+            if _EXIT_RE.search(text):
                 print("\n[Voice: Exiting...]")
                 self.session.stop()
                 return
@@ -263,6 +96,11 @@ def main():
     recorder = None
 
     try:
+        # Start Claude first so its boot overlaps the model load below;
+        # by the time the recorder is ready the PTY is long writable
+        session = ClaudeInteractiveSession(claude_path)
+        session.start()
+
         recorder = AudioToTextRecorder(
             spinner=False,  # Disable spinner to avoid terminal conflicts
             language="en",
@@ -276,20 +114,29 @@ def main():
         print('  - Say "Claude exit" or press Ctrl+C to quit')
         print("\n" + "=" * 60)
 
-        # Start Claude interactive session
-        session = ClaudeInteractiveSession(claude_path)
-        session.start()
-
-        # Give Claude time to initialize
-        import time
-        time.sleep(1)
-
         # Create voice handler
         voice_handler = VoiceHandler(session)
 
-        # Use callback-based voice processing (non-blocking)
+        # recorder.text() blocks until an utterance finishes, so run it on
+        # a worker thread; the main loop then reacts to transcripts as they
+        # arrive and notices session exit within 200 ms
+        text_queue = queue.Queue()
+
+        def stt_worker():
+            while session.running:
+                text = recorder.text()
+                if text:
+                    text_queue.put(text)
+
+        stt_thread = threading.Thread(target=stt_worker, daemon=True)
+        stt_thread.start()
+
         while session.running:
-            recorder.text(voice_handler.process_text)
+            try:
+                text = text_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            voice_handler.process_text(text)
 
     except KeyboardInterrupt:
         print("\n\n[Exiting...]")
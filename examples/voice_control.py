@@ -1,44 +1,41 @@
 #!/usr/bin/env python3
 """
 Voice control example for Claude Code CLI
+
+Keeps one interactive Claude session alive and forwards each voice
+command to it, instead of paying CLI startup cost on every utterance.
 """
 
 from RealtimeSTT import AudioToTextRecorder
-import subprocess
+from _claude_common import (
+    ClaudeInteractiveSession,
+    extract_command,
+    find_claude_binary,
+    reset_terminal,
+)
 import sys
 
-def execute_command(text):
+def execute_command(session, text):
     """Execute voice commands"""
     text_lower = text.lower().strip()
 
     # Claude Code commands
-    if "claude" in text_lower:
-        # Extract command after "claude"
-        cmd = text_lower.split("claude", 1)[1].strip()
-        print(f"Executing: claude {cmd}")
-        try:
-            result = subprocess.run(
-                ["claude", cmd],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            print(result.stdout)
-            if result.stderr:
-                print(f"Error: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            print("Command timed out")
-        except Exception as e:
-            print(f"Error executing command: {e}")
+    cmd = extract_command(text)
+    if cmd is not None:
+        if cmd:
+            print(f"Sending to Claude: {cmd}")
+            session.send_command(cmd)
+        return
 
     # System commands
-    elif "exit" in text_lower or "quit" in text_lower:
+    if "exit" in text_lower or "quit" in text_lower:
         print("Exiting voice control...")
+        session.stop()
         sys.exit(0)
 
     elif "help" in text_lower:
         print("\nVoice Commands:")
-        print("  'claude [command]' - Execute Claude Code command")
+        print("  'claude [command]' - Send command to Claude Code")
         print("  'help' - Show this help")
         print("  'exit' or 'quit' - Exit voice control")
 
@@ -50,27 +47,41 @@ def main():
     print("=" * 60)
     print("Voice Control for Claude Code CLI")
     print("=" * 60)
+
+    claude_path = find_claude_binary()
+    if not claude_path:
+        print("\nError: 'claude' command not found.")
+        print("Install with: npm install -g @anthropic-ai/claude-code")
+        sys.exit(1)
+
     print("\nInitializing voice recognition...")
 
+    session = None
     try:
-        recorder = AudioToTextRecorder()
+        # Start the persistent Claude session; it boots while the
+        # speech model loads
+        session = ClaudeInteractiveSession(claude_path)
+        session.start()
+
+        recorder = AudioToTextRecorder(spinner=False)
         print(" Voice control ready!")
         print("\nSay 'help' for available commands")
         print("Press Ctrl+C to exit\n")
         print("=" * 60)
 
-        while True:
-            print("\n Listening...")
+        while session.running:
             text = recorder.text()
-            print(f" Heard: {text}")
-            execute_command(text)
+            execute_command(session, text)
 
     except KeyboardInterrupt:
         print("\n\nExiting...")
-        sys.exit(0)
     except Exception as e:
         print(f"\n Error: {e}")
         sys.exit(1)
+    finally:
+        if session:
+            session.stop()
+        reset_terminal()
 
 if __name__ == '__main__':
     main()
@@ -60,6 +60,10 @@ def test_platform():
 def test_mlx():
     """Test MLX framework"""
     print("\nChecking MLX framework...")
+    import platform
+    if platform.machine() != "arm64":
+        print("  Not Apple Silicon - MLX not required, skipping import")
+        return True
     try:
         import mlx.core as mx
         print(f"  MLX version: {mx.__version__ if hasattr(mx, '__version__') else 'installed'}")